@@ -1,22 +1,290 @@
 """
 Amazon Book Data Parser - Python Example
 
-Requirements:
-    pip install requests beautifulsoup4 lxml
+Requirements (Python 3.10+):
+    pip install requests lxml cssselect
+    pip install aiohttp  # only for parse_many
+    pip install orjson   # optional, faster JSON decoding
 
 Usage:
-    from amazon_parser import parse_amazon_book
-    book_data = parse_amazon_book("8556512666")
+    from amazon_parser import parse_amazon_book, parse_many
+    book = parse_amazon_book("8556512666")
+    print(book.title, book.to_dict())
+    books = parse_many(["8556512666", "8595084742"])
 """
 
+import asyncio
+import copy
+import json
 import re
-import requests
-from bs4 import BeautifulSoup
-from urllib.parse import quote
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
 from typing import Dict, List, Optional
+from urllib.parse import quote
 
-
-def parse_amazon_book(identifier: str) -> Dict:
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from lxml import etree
+from lxml.cssselect import CSSSelector
+
+try:
+    import aiohttp
+except ImportError:  # only needed for parse_many
+    aiohttp = None
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+_AMAZON_URL_PREFIX = 'https://www.amazon.com.br/dp/'
+_PROXY_URL_PREFIX = 'https://corsproxy.io/?' + quote(_AMAZON_URL_PREFIX)
+
+_MAX_RETRIES = 3
+_RETRY_BACKOFF = 0.3
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Upper bound on a server-sent Retry-After, so one throttled request can't
+# block a caller or hold its parse_many slot for minutes
+_MAX_RETRY_AFTER = 30
+
+try:
+    _RETRY = Retry(
+        total=_MAX_RETRIES,
+        backoff_factor=_RETRY_BACKOFF,
+        status_forcelist=_RETRY_STATUSES,
+        retry_after_max=_MAX_RETRY_AFTER,
+    )
+except TypeError:  # urllib3 without retry_after_max: ignore Retry-After
+    _RETRY = Retry(
+        total=_MAX_RETRIES,
+        backoff_factor=_RETRY_BACKOFF,
+        status_forcelist=_RETRY_STATUSES,
+        respect_retry_after_header=False,
+    )
+
+# One pooled session reuses the TCP/TLS connection to the proxy across calls
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=_RETRY,
+))
+
+# Parsed books shared by parse_amazon_book and parse_many, keyed by
+# identifier and evicted least recently used first
+_CACHE_SIZE = 4096
+_BOOK_CACHE: 'OrderedDict[str, BookData]' = OrderedDict()
+_BOOK_CACHE_LOCK = threading.Lock()
+
+# Concurrency limits for parse_many
+_BATCH_CONCURRENCY = 64
+_BATCH_CONNECTION_LIMIT = 512
+
+# Pages are streamed and only the bytes up to shortly after the product
+# details block are kept and parsed; the reviews and recommendations that
+# follow are read and dropped. The body is always drained so the
+# connection goes back to the pool instead of being closed.
+_CHUNK_SIZE = 64 * 1024
+_MAX_HTML_BYTES = 2 * 1024 * 1024
+_DETAILS_TAIL_BYTES = 32 * 1024
+# Match the attribute, not the bare name: inline CSS/JS in <head> mentions
+# these ids long before the details block itself.
+_DETAILS_MARKER_RE = re.compile(
+    rb'id=["\']?(?:detailBullets_feature_div|detail_bullets_id|productDetailsTable)\b'
+    rb'|class=["\'][^"\']{0,200}\bdetail-bullet-list\b'
+)
+# Longest possible marker match, kept as overlap between chunk scans
+_DETAILS_MARKER_MAX_LENGTH = 256
+
+# CSS selectors are translated to XPath once here rather than on every
+# call to parse_amazon_book.
+_SELECTORS = {key: CSSSelector(css) for key, css in {
+    'title': '#productTitle, span[id="productTitle"]',
+    'authors': '.author a.a-link-normal, .author .contributorNameID',
+    'image': '#landingImage, #imgBlkFront, #ebooksImgBlkFront',
+    'categories': '#wayfinding-breadcrumbs_feature_div a, .a-breadcrumb a',
+}.items()}
+
+_DESCRIPTION_SELECTORS = [CSSSelector(css) for css in (
+    '#bookDescription_feature_div noscript',
+    '#bookDescription_feature_div .a-expander-content',
+    '#feature-bullets ul.a-unordered-list',
+)]
+
+_DETAILS_SELECTORS = [CSSSelector(css) for css in (
+    '#detailBullets_feature_div',
+    '#detail_bullets_id',
+    '#productDetailsTable',
+    '#detailBulletsWrapper_feature_div',
+    '.detail-bullet-list',
+)]
+
+# The details containers are alternative layouts of the same block, so the
+# first one with at least this much text is enough.
+_DETAILS_MIN_LENGTH = 200
+
+# Only these subtrees are kept while parsing; every selector above starts
+# inside one of them, so the rest of the page can be discarded as it goes.
+_WANTED_IDS = frozenset((
+    'productTitle',
+    'landingImage', 'imgBlkFront', 'ebooksImgBlkFront',
+    'bookDescription_feature_div', 'feature-bullets',
+    'detailBullets_feature_div', 'detail_bullets_id', 'productDetailsTable',
+    'detailBulletsWrapper_feature_div',
+    'wayfinding-breadcrumbs_feature_div',
+))
+_WANTED_CLASSES = frozenset(('author', 'a-breadcrumb', 'detail-bullet-list'))
+
+# Regex patterns are compiled once at import time so batch parsing doesn't
+# pay the re module cache lookup on every call. In the ASCII-only patterns
+# the labels and captures are wrapped in (?a:...) for cheaper case folding,
+# while separators and \b stay Unicode-aware so any Unicode space (NBSP,
+# thin space, ...) still separates a label from its value.
+_ISBN10_RE = re.compile(r'(?a:ISBN-10)[:\s]+(?a:([0-9X]{10}))', re.IGNORECASE)
+_ISBN13_RE = re.compile(r'(?a:ISBN-13)[:\s]+(?a:([0-9-]{13,17}))', re.IGNORECASE)
+
+_ASIN_RE_1 = re.compile(r'(?a:ASIN)[:\s]+(?a:([A-Z0-9]{10}))(?:\s|$)', re.IGNORECASE)
+_ASIN_RE_2 = re.compile(r'\b(?a:ASIN)[:\s]*(?a:([A-Z0-9]{10}))\b', re.IGNORECASE)
+_ASIN_RES = [_ASIN_RE_1, _ASIN_RE_2]
+
+# Single pass over the details text; the {1,80} bound keeps the lazy class
+# from backtracking across the whole blob on malformed pages.
+_PUBLISHER_RE = re.compile(
+    r'(?:editora|publisher)\s+([a-zà-ÿ\s&\-\.]{1,80}?)\s+'
+    r'(?:data\s+da\s+publicação|dimensões|isbn|asin|publication\s+date)',
+    re.IGNORECASE,
+)
+
+_MONTHS = {
+    'janeiro': '01', 'fevereiro': '02', 'março': '03', 'abril': '04',
+    'maio': '05', 'junho': '06', 'julho': '07', 'agosto': '08',
+    'setembro': '09', 'outubro': '10', 'novembro': '11', 'dezembro': '12',
+}
+
+# Matches both "25 novembro 2019" and "25 de novembro de 2019"
+_DATE_RE = re.compile(
+    r'(\d{1,2})\s+(?:de\s+)?(' + '|'.join(_MONTHS) + r')\s+(?:de\s+)?(\d{4})',
+    re.IGNORECASE,
+)
+
+# Captures below are length-bounded so a malformed page can't make a
+# pattern run over the rest of the details text.
+_PAGES_RES = [
+    re.compile(r'(\d{1,5})\s*páginas', re.IGNORECASE),
+    re.compile(r'Comprimento[:\s]+(\d{1,5})\s*páginas', re.IGNORECASE),
+    re.compile(r'(?a:Length)[:\s]+(?a:(\d{1,5}))\s*(?a:pages)', re.IGNORECASE),
+]
+
+_LANG_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'Idioma[:\s]+([^\n;]{1,100})',
+    r'Language[:\s]+([^\n;]{1,100})',
+)]
+
+# Every details pattern above starts at one of these labels. The details
+# text is scanned once for all of them and each field's pattern is then
+# only tried at its own label offsets.
+_DETAILS_LABELS_RE = re.compile(
+    r'(?P<isbn10>ISBN-10)'
+    r'|(?P<isbn13>ISBN-13)'
+    r'|(?P<asin>ASIN)'
+    r'|(?P<publisher>editora|publisher)'
+    r'|(?P<pages>(?<!\d)\d{1,5}\s*páginas|comprimento|length)'
+    r'|(?P<language>idioma|language)',
+    re.IGNORECASE,
+)
+
+_LANGUAGE_MAP = {
+    'português': 'pt-BR',
+    'portuguese': 'pt-BR',
+    'inglês': 'en',
+    'english': 'en',
+    'espanhol': 'es',
+    'spanish': 'es',
+    'francês': 'fr',
+    'french': 'fr',
+    'alemão': 'de',
+    'german': 'de',
+    'italiano': 'it',
+    'italian': 'it',
+}
+
+_CATEGORY_MAP = {
+    'ficção': 'Fiction',
+    'fiction': 'Fiction',
+    'romance': 'Romance',
+    'fantasia': 'Fantasy',
+    'fantasy': 'Fantasy',
+    'mistério': 'Mystery',
+    'mystery': 'Mystery',
+    'terror': 'Horror',
+    'horror': 'Horror',
+}
+_CATEGORY_ITEMS = tuple(_CATEGORY_MAP.items())
+_CATEGORY_KEYS = frozenset(_CATEGORY_MAP)
+
+# Map keys are single words, so text is split into words and looked up
+_WORD_RE = re.compile(r'\w+')
+
+
+@dataclass(slots=True)
+class BookData:
+    """Book fields extracted from an Amazon product page."""
+
+    title: Optional[str] = None
+    authors: List[str] = field(default_factory=list)
+    image_url: Optional[str] = None
+    description: Optional[str] = None
+    isbn10: Optional[str] = None
+    isbn: Optional[str] = None
+    isbn13: Optional[str] = None
+    asin: Optional[str] = None
+    publisher: Optional[str] = None
+    published_date: Optional[str] = None
+    page_count: Optional[int] = None
+    language: Optional[str] = None
+    categories: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        """Return the extracted fields keyed like the other examples' JSON output."""
+        data = {}
+        for book_field in fields(self):
+            value = getattr(self, book_field.name)
+            if value is not None and value != []:
+                data[_BOOK_DATA_KEYS.get(book_field.name, book_field.name)] = value
+        return data
+
+
+# JSON keys that differ from the BookData attribute names
+_BOOK_DATA_KEYS = {
+    'image_url': 'imageUrl',
+    'published_date': 'publishedDate',
+    'page_count': 'pageCount',
+}
+
+
+def _index_details_labels(details_text: str) -> Dict[str, List[int]]:
+    """Map each details field to the offsets where its label appears."""
+    offsets = {}
+    for label_match in _DETAILS_LABELS_RE.finditer(details_text):
+        offsets.setdefault(label_match.lastgroup, []).append(label_match.start())
+    return offsets
+
+
+def _match_at(pattern: re.Pattern, text: str, offsets: List[int]) -> Optional[re.Match]:
+    """Return the first match of pattern anchored at one of the offsets."""
+    for offset in offsets:
+        match = pattern.match(text, offset)
+        if match:
+            return match
+    return None
+
+
+def parse_amazon_book(identifier: str) -> BookData:
     """
     Parse book data from Amazon.com.br product page.
 
@@ -24,234 +292,421 @@ def parse_amazon_book(identifier: str) -> Dict:
         identifier: ISBN-10, ISBN-13, or ASIN
 
     Returns:
-        Dictionary with book data
+        BookData with the extracted fields
+
+    Results are cached per identifier, so repeated lookups skip the
+    network; each call returns its own copy.
     """
-    amazon_url = f"https://www.amazon.com.br/dp/{identifier.strip()}"
-    proxy_url = f"https://corsproxy.io/?{quote(amazon_url)}"
+    identifier = identifier.strip()
+    cached = _cache_get(identifier)
+    if cached is not None:
+        return cached
+
+    amazon_url = _AMAZON_URL_PREFIX + identifier
+    proxy_url = _proxy_url(identifier)
 
     print(f"🔍 Fetching: {amazon_url}")
 
     try:
-        response = requests.get(proxy_url, timeout=30)
-        response.raise_for_status()
+        with _SESSION.get(proxy_url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            page = _PageBuffer()
+            for chunk in response.iter_content(_CHUNK_SIZE):
+                page.feed(chunk)
+            html = page.decode(response.encoding)
     except requests.RequestException as e:
         raise Exception(f"Failed to fetch URL: {e}")
 
-    html = response.text
-    soup = BeautifulSoup(html, 'lxml')
+    book = _parse_html(html)
+    _cache_put(identifier, book)
+
+    print(f"✅ Extracted {len(book.to_dict())} fields")
+    return book
+
+
+async def parse_amazon_book_async(identifier: str,
+                                  session: 'aiohttp.ClientSession',
+                                  semaphore: Optional[asyncio.Semaphore] = None,
+                                  executor: Optional[Executor] = None) -> BookData:
+    """
+    Async variant of parse_amazon_book for batch use.
+
+    Args:
+        identifier: ISBN-10, ISBN-13, or ASIN
+        session: Shared aiohttp session used for the request
+        semaphore: Optional limit on concurrent requests
+        executor: Optional executor for the CPU-bound HTML parsing
+
+    Returns:
+        BookData with the extracted fields
+
+    Shares parse_amazon_book's per-identifier cache.
+    """
+    identifier = identifier.strip()
+    cached = _cache_get(identifier)
+    if cached is not None:
+        return cached
+
+    amazon_url = _AMAZON_URL_PREFIX + identifier
+    proxy_url = _proxy_url(identifier)
+
+    print(f"🔍 Fetching: {amazon_url}")
+
+    if semaphore is None:
+        html = await _fetch_html_async(session, proxy_url)
+    else:
+        async with semaphore:
+            html = await _fetch_html_async(session, proxy_url)
+
+    loop = asyncio.get_running_loop()
+    book = await loop.run_in_executor(executor, _parse_html, html)
+    _cache_put(identifier, book)
+
+    print(f"✅ Extracted {len(book.to_dict())} fields")
+    return book
 
-    book_data = {}
+
+def parse_many(identifiers: List[str]) -> List[Optional[BookData]]:
+    """
+    Fetch and parse several books concurrently.
+
+    A failure for one identifier doesn't abort the batch: the error is
+    logged and that position holds None.
+
+    Args:
+        identifiers: ISBN-10, ISBN-13, or ASIN values
+
+    Returns:
+        List of BookData (or None on failure), in the same order as identifiers
+    """
+    if aiohttp is None:
+        raise Exception("parse_many requires aiohttp: pip install aiohttp")
+
+    return asyncio.run(_parse_many(identifiers))
+
+
+async def _parse_many(identifiers: List[str]) -> List[Optional[BookData]]:
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+    connector = aiohttp.TCPConnector(limit=_BATCH_CONNECTION_LIMIT,
+                                     limit_per_host=_BATCH_CONCURRENCY)
+
+    # Repeated identifiers are fetched once and copied into each slot
+    unique = list(dict.fromkeys(identifier.strip() for identifier in identifiers))
+
+    with ProcessPoolExecutor() as executor:
+        async with aiohttp.ClientSession(connector=connector) as session:
+            results = await asyncio.gather(*[
+                parse_amazon_book_async(identifier, session, semaphore, executor)
+                for identifier in unique
+            ], return_exceptions=True)
+
+    by_identifier = {}
+    for identifier, result in zip(unique, results):
+        if isinstance(result, BaseException):
+            print(f"❌ {identifier}: {result}")
+            result = None
+        by_identifier[identifier] = result
+
+    return [copy.deepcopy(by_identifier[identifier.strip()]) for identifier in identifiers]
+
+
+def _cache_get(identifier: str) -> Optional[BookData]:
+    """Return a copy of the cached book for identifier, if any."""
+    with _BOOK_CACHE_LOCK:
+        book = _BOOK_CACHE.get(identifier)
+        if book is None:
+            return None
+        _BOOK_CACHE.move_to_end(identifier)
+    return copy.deepcopy(book)
+
+
+def _cache_put(identifier: str, book: BookData) -> None:
+    """Cache a copy of book, unless nothing was extracted from the page."""
+    # An empty result usually means a captcha or block page served with
+    # status 200; caching it would keep that identifier broken for good
+    if not book.to_dict():
+        return
+
+    with _BOOK_CACHE_LOCK:
+        _BOOK_CACHE[identifier] = copy.deepcopy(book)
+        _BOOK_CACHE.move_to_end(identifier)
+        if len(_BOOK_CACHE) > _CACHE_SIZE:
+            _BOOK_CACHE.popitem(last=False)
+
+
+def _proxy_url(identifier: str) -> str:
+    """Build the proxied product URL for an already stripped identifier."""
+    # ISBNs and ASINs are plain ASCII alphanumerics and need no escaping
+    if identifier.isascii() and identifier.isalnum():
+        return _PROXY_URL_PREFIX + identifier
+    return _PROXY_URL_PREFIX + quote(identifier)
+
+
+class _PageBuffer:
+    """Collects streamed page bytes up to the end of the details block."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.limit = _MAX_HTML_BYTES
+        self.details_seen = False
+
+    def feed(self, chunk: bytes) -> None:
+        """Append chunk, discarding anything past the bytes we need."""
+        if len(self.data) >= self.limit:
+            return
+
+        scan_from = max(0, len(self.data) - _DETAILS_MARKER_MAX_LENGTH)
+        self.data += chunk
+
+        if not self.details_seen:
+            marker = _DETAILS_MARKER_RE.search(self.data, scan_from)
+            if marker:
+                self.details_seen = True
+                self.limit = min(marker.end() + _DETAILS_TAIL_BYTES, _MAX_HTML_BYTES)
+
+        del self.data[self.limit:]
+
+    def decode(self, encoding: Optional[str]) -> str:
+        return self.data.decode(encoding or 'utf-8', errors='replace')
+
+
+async def _fetch_html_async(session: 'aiohttp.ClientSession', url: str) -> str:
+    """Fetch url, retrying throttled/failed responses with backoff."""
+    timeout = aiohttp.ClientTimeout(total=30)
+
+    for attempt in range(_MAX_RETRIES + 1):
+        try:
+            async with session.get(url, timeout=timeout) as response:
+                if response.status in _RETRY_STATUSES and attempt < _MAX_RETRIES:
+                    retry_after = response.headers.get('Retry-After', '')
+                    if retry_after.isdigit():
+                        delay = min(int(retry_after), _MAX_RETRY_AFTER)
+                    else:
+                        delay = _RETRY_BACKOFF * (2 ** attempt)
+                else:
+                    response.raise_for_status()
+                    page = _PageBuffer()
+                    async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+                        page.feed(chunk)
+                    return page.decode(response.charset)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise Exception(f"Failed to fetch URL: {e}")
+
+        await asyncio.sleep(delay)
+
+
+def _is_wanted(elem: etree._Element) -> bool:
+    if elem.get('id') in _WANTED_IDS:
+        return True
+    classes = elem.get('class')
+    return classes is not None and not _WANTED_CLASSES.isdisjoint(classes.split())
+
+
+def _parse_wanted_subtrees(html: str) -> etree._Element:
+    """
+    Parse html incrementally, keeping only the subtrees the selectors need.
+
+    Wanted elements are moved under a detached root as soon as they are
+    closed; everything else is cleared so memory stays proportional to the
+    kept subtrees rather than the whole page.
+
+    This trades CPU for memory: every start/end event is handled in Python,
+    which makes it 2-4x slower than lxml.html.fromstring (about 15 ms vs
+    8 ms on a page already cut off by _PageBuffer, 100 ms vs 26 ms on an
+    uncut ~800 KB page).
+    """
+    parser = etree.HTMLPullParser(events=('start', 'end'))
+    kept = etree.Element('div')
+    depth = 0  # how many wanted elements we are currently inside
+
+    def handle_events():
+        nonlocal depth
+        for event, elem in parser.read_events():
+            if event == 'start':
+                if _is_wanted(elem):
+                    depth += 1
+            elif _is_wanted(elem):
+                depth -= 1
+                if depth == 0:
+                    kept.append(elem)
+            elif depth == 0:
+                elem.clear(keep_tail=True)
+                parent = elem.getparent()
+                # The root's previous siblings (doctype comments etc.) sit at
+                # document level and have no parent to delete them from
+                if parent is not None:
+                    while elem.getprevious() is not None:
+                        del parent[0]
+
+    for start in range(0, len(html), _CHUNK_SIZE):
+        parser.feed(html[start:start + _CHUNK_SIZE])
+        handle_events()
+    parser.close()
+    handle_events()
+
+    return kept
+
+
+def _element_text(elem: etree._Element) -> str:
+    """Return the element's text with whitespace runs collapsed to one space."""
+    return ' '.join(''.join(elem.itertext()).split())
+
+
+def _parse_html(html: str) -> BookData:
+    """Extract book data from an Amazon product page."""
+    tree = _parse_wanted_subtrees(html)
+
+    book = BookData()
 
     # 1. Title
-    title_el = soup.select_one('#productTitle, span[id="productTitle"]')
-    if title_el:
-        book_data['title'] = title_el.get_text(strip=True)
+    title_els = _SELECTORS['title'](tree)
+    if title_els:
+        book.title = _element_text(title_els[0])
 
     # 2. Authors
-    author_elements = soup.select('.author a.a-link-normal, .author .contributorNameID')
+    author_elements = _SELECTORS['authors'](tree)
     authors = []
+    seen_authors = set()
     for el in author_elements:
-        author = el.get_text(strip=True)
-        if author and '(' not in author and author not in authors:
+        author = _element_text(el)
+        if author and '(' not in author and author not in seen_authors:
+            seen_authors.add(author)
             authors.append(author)
     if authors:
-        book_data['authors'] = authors
+        book.authors = authors
 
     # 3. Cover Image
-    img_el = soup.select_one('#landingImage, #imgBlkFront, #ebooksImgBlkFront')
-    if img_el:
+    img_els = _SELECTORS['image'](tree)
+    if img_els:
+        img_el = img_els[0]
         img_src = (img_el.get('data-old-hires') or
                    img_el.get('src') or
                    img_el.get('data-a-dynamic-image'))
 
         if img_src:
             if img_src.startswith('{'):
-                import json
                 try:
-                    img_obj = json.loads(img_src)
-                    urls = list(img_obj.keys())
-                    if urls:
-                        book_data['imageUrl'] = urls[0]
+                    img_obj = _json_loads(img_src)
+                    first_url = next(iter(img_obj), None)
+                    if first_url:
+                        book.image_url = first_url
                 except json.JSONDecodeError:
-                    book_data['imageUrl'] = img_src
+                    book.image_url = img_src
             else:
-                book_data['imageUrl'] = img_src
+                book.image_url = img_src
 
     # 4. Description
-    desc_selectors = [
-        '#bookDescription_feature_div noscript',
-        '#bookDescription_feature_div .a-expander-content',
-        '#feature-bullets ul.a-unordered-list'
-    ]
-
-    for selector in desc_selectors:
-        desc_el = soup.select_one(selector)
-        if desc_el:
-            desc = desc_el.get_text(strip=True)
+    for selector in _DESCRIPTION_SELECTORS:
+        desc_els = selector(tree)
+        if desc_els:
+            desc = _element_text(desc_els[0])
             if desc and len(desc) > 50:
-                book_data['description'] = desc
+                book.description = desc
                 break
 
     # Get details text
-    details_selectors = [
-        '#detailBullets_feature_div',
-        '#detail_bullets_id',
-        '#productDetailsTable',
-        '#detailBulletsWrapper_feature_div',
-        '.detail-bullet-list'
-    ]
-
-    details_text = ''
-    for selector in details_selectors:
-        el = soup.select_one(selector)
-        if el:
-            details_text += ' ' + el.get_text()
+    details_parts = []
+    for selector in _DETAILS_SELECTORS:
+        els = selector(tree)
+        if els:
+            block_text = ''.join(els[0].itertext())
+            details_parts.append(block_text)
+            if len(block_text) >= _DETAILS_MIN_LENGTH:
+                break
+
+    details_text = ' '.join(details_parts)
+
+    labels = _index_details_labels(details_text)
 
     # 5. ISBN-10
-    isbn10_match = re.search(r'ISBN-10[:\s]+([0-9X]{10})', details_text, re.IGNORECASE)
+    isbn10_match = _match_at(_ISBN10_RE, details_text, labels.get('isbn10', []))
     if isbn10_match:
-        book_data['isbn10'] = isbn10_match.group(1)
-        book_data['isbn'] = isbn10_match.group(1)
+        book.isbn10 = isbn10_match.group(1)
+        book.isbn = isbn10_match.group(1)
 
     # 6. ISBN-13
-    isbn13_match = re.search(r'ISBN-13[:\s]+([0-9-]{13,17})', details_text, re.IGNORECASE)
+    isbn13_match = _match_at(_ISBN13_RE, details_text, labels.get('isbn13', []))
     if isbn13_match:
         isbn13 = isbn13_match.group(1).replace('-', '')
-        book_data['isbn13'] = isbn13
-        if 'isbn' not in book_data:
-            book_data['isbn'] = isbn13
+        book.isbn13 = isbn13
+        if book.isbn is None:
+            book.isbn = isbn13
 
     # 7. ASIN
-    asin_patterns = [
-        r'ASIN[:\s]+([A-Z0-9]{10})(?:\s|$)',
-        r'\bASIN[:\s]*([A-Z0-9]{10})\b',
-    ]
-
-    for pattern in asin_patterns:
-        asin_match = re.search(pattern, details_text, re.IGNORECASE)
+    for pattern in _ASIN_RES:
+        asin_match = _match_at(pattern, details_text, labels.get('asin', []))
         if asin_match:
             potential_asin = asin_match.group(1).upper()
-            if re.match(r'^[A-Z0-9]{10}$', potential_asin) and not re.match(r'^[A-Z]+$', potential_asin):
-                book_data['asin'] = potential_asin
+            if (len(potential_asin) == 10 and potential_asin.isascii() and
+                    potential_asin.isalnum() and not potential_asin.isalpha()):
+                book.asin = potential_asin
                 break
 
     # 8. Publisher
-    publisher_patterns = [
-        r'editora\s+([a-zà-ÿ\s&\-\.]+?)\s+data\s+da\s+publicação',
-        r'editora\s+([a-zà-ÿ\s&\-\.]+?)\s+dimensões',
-        r'editora\s+([a-zà-ÿ\s&\-\.]+?)\s+(?:isbn|asin)',
-        r'publisher\s+([a-z\s&\-\.]+?)\s+publication\s+date',
-    ]
-
-    for pattern in publisher_patterns:
-        publisher_match = re.search(pattern, details_text.lower(), re.IGNORECASE)
-        if publisher_match:
-            publisher = publisher_match.group(1).strip()
-            # Capitalize each word
-            publisher = ' '.join(word.capitalize() for word in publisher.split())
-
-            if len(publisher) > 1 and not publisher.isdigit():
-                book_data['publisher'] = publisher
-                break
+    for offset in labels.get('publisher', []):
+        publisher_match = _PUBLISHER_RE.match(details_text, offset)
+        if not publisher_match:
+            continue
 
-    # 9. Publication Date
-    months = {
-        'janeiro': '01', 'fevereiro': '02', 'março': '03', 'abril': '04',
-        'maio': '05', 'junho': '06', 'julho': '07', 'agosto': '08',
-        'setembro': '09', 'outubro': '10', 'novembro': '11', 'dezembro': '12',
-    }
-
-    date_patterns = [
-        (r'(\d{1,2})\s+(janeiro|fevereiro|março|abril|maio|junho|julho|agosto|setembro|outubro|novembro|dezembro)\s+(\d{4})', 'br-short'),
-        (r'(\d{1,2})\s+de\s+(janeiro|fevereiro|março|abril|maio|junho|julho|agosto|setembro|outubro|novembro|dezembro)\s+de\s+(\d{4})', 'br-long'),
-    ]
-
-    for pattern, format_type in date_patterns:
-        date_match = re.search(pattern, html, re.IGNORECASE)
-        if date_match:
-            day = date_match.group(1).zfill(2)
-            month = months[date_match.group(2).lower()]
-            year = date_match.group(3)
-            book_data['publishedDate'] = f"{year}-{month}-{day}"
+        publisher = publisher_match.group(1).strip()
+        # Capitalize each word
+        publisher = ' '.join(word.capitalize() for word in publisher.split())
+
+        if len(publisher) > 1 and not publisher.isdigit():
+            book.publisher = publisher
             break
 
+    # 9. Publication Date
+    # The details block is much smaller than the page, so look there first
+    date_match = _DATE_RE.search(details_text) or _DATE_RE.search(html)
+    if date_match:
+        day = date_match.group(1).zfill(2)
+        month = _MONTHS[date_match.group(2).lower()]
+        year = date_match.group(3)
+        book.published_date = f"{year}-{month}-{day}"
+
     # 10. Pages
-    pages_patterns = [
-        r'(\d+)\s*páginas',
-        r'Comprimento[:\s]+(\d+)\s*páginas',
-        r'Length[:\s]+(\d+)\s*pages',
-    ]
-
-    for pattern in pages_patterns:
-        pages_match = re.search(pattern, details_text, re.IGNORECASE)
+    for pattern in _PAGES_RES:
+        pages_match = _match_at(pattern, details_text, labels.get('pages', []))
         if pages_match:
-            book_data['pageCount'] = int(pages_match.group(1))
+            book.page_count = int(pages_match.group(1))
             break
 
     # 11. Language
-    lang_patterns = [
-        r'Idioma[:\s]+([^\n;]+)',
-        r'Language[:\s]+([^\n;]+)',
-    ]
-
-    language_map = {
-        'português': 'pt-BR',
-        'portuguese': 'pt-BR',
-        'inglês': 'en',
-        'english': 'en',
-        'espanhol': 'es',
-        'spanish': 'es',
-        'francês': 'fr',
-        'french': 'fr',
-        'alemão': 'de',
-        'german': 'de',
-        'italiano': 'it',
-        'italian': 'it',
-    }
-
-    for pattern in lang_patterns:
-        lang_match = re.search(pattern, details_text, re.IGNORECASE)
+    for pattern in _LANG_RES:
+        lang_match = _match_at(pattern, details_text, labels.get('language', []))
         if lang_match:
             lang_text = lang_match.group(1).strip().lower()
 
-            for key, value in language_map.items():
-                if key in lang_text:
-                    book_data['language'] = value
+            for word in _WORD_RE.findall(lang_text):
+                if word in _LANGUAGE_MAP:
+                    book.language = _LANGUAGE_MAP[word]
                     break
 
-            if 'language' in book_data:
+            if book.language is not None:
                 break
 
     # 12. Categories
-    category_elements = soup.select('#wayfinding-breadcrumbs_feature_div a, .a-breadcrumb a')
+    category_elements = _SELECTORS['categories'](tree)
     categories = []
-
-    category_map = {
-        'ficção': 'Fiction',
-        'fiction': 'Fiction',
-        'romance': 'Romance',
-        'fantasia': 'Fantasy',
-        'fantasy': 'Fantasy',
-        'mistério': 'Mystery',
-        'mystery': 'Mystery',
-        'terror': 'Horror',
-        'horror': 'Horror',
-    }
+    seen_categories = set()
 
     for el in category_elements:
-        text = el.get_text(strip=True)
+        text = _element_text(el)
         if text and 3 < len(text) < 50:
-            normalized = text.lower()
+            words = set(_WORD_RE.findall(text.lower()))
+            if _CATEGORY_KEYS.isdisjoint(words):
+                continue
 
-            for key, value in category_map.items():
-                if key in normalized and value not in categories:
+            for key, value in _CATEGORY_ITEMS:
+                if key in words and value not in seen_categories:
+                    seen_categories.add(value)
                     categories.append(value)
 
     if categories:
-        book_data['categories'] = categories
+        book.categories = categories
 
-    print(f"✅ Extracted {len(book_data)} fields")
-    return book_data
+    return book
 
 
 if __name__ == '__main__':
@@ -259,5 +714,4 @@ if __name__ == '__main__':
     isbn = "8556512666"
     book = parse_amazon_book(isbn)
 
-    import json
-    print(json.dumps(book, indent=2, ensure_ascii=False))
+    print(json.dumps(book.to_dict(), indent=2, ensure_ascii=False))